@@ -7,16 +7,14 @@ and a callable that docks the panel.
 from typing import Optional
 
 import nuke  # type: ignore
-import nukescripts  # type: ignore
-from nukescripts import panels  # type: ignore
 
 
 nuke.pluginAddPath('./nuke_tools')
 
-# Tools on NUKE_PATH
-from switch_manager import SwitchManagerPanel  # type: ignore
-
-PANEL_CLASS = 'SwitchManagerPanel'
+# Resolved lazily by nukescripts when the pane is first created, so the Qt
+# panel module (tools on NUKE_PATH) is never imported in sessions that do not
+# open it.
+PANEL_CLASS = "__import__('switch_manager').SwitchManagerPanel"
 PANEL_NAME = 'Switch Manager'
 NEW_PANEL_ID = 'uk.co.bcn.multishot.switch_manager'
 LEGACY_PANEL_ID = 'uk.co.bcn.multishot.screens_manager'
@@ -26,6 +24,8 @@ def add_switch_manager_panel() -> Optional[object]:
     """Create and dock the Switch Manager panel next to Properties."""
 
     try:
+        from nukescripts import panels  # type: ignore
+
         pane = nuke.getPaneFor('Properties.1')
         registered = panels.registerWidgetAsPanel(
             PANEL_CLASS,
@@ -38,19 +38,29 @@ def add_switch_manager_panel() -> Optional[object]:
         return None
 
 
-# GUI-only wiring
 try:
-    if nuke.env['gui']:
+    _GUI = bool(nuke.env['gui'])
+except Exception:
+    _GUI = False
+
+
+# GUI-only wiring; terminal/farm sessions skip straight past this block.
+if _GUI:
+    try:
+        import nukescripts  # type: ignore
+
+        # Resolve each menu once and reuse the handles below.
+        _pane_menu = nuke.menu('Pane')
+        _nuke_menu = nuke.menu('Nuke')
+        _bcn_menu = _nuke_menu.findItem('BCN Multishot') or _nuke_menu.addMenu('BCN Multishot')
+
         # Pane menu entry
-        nuke.menu('Pane').addCommand(PANEL_NAME, add_switch_manager_panel)
+        _pane_menu.addCommand(PANEL_NAME, add_switch_manager_panel)
         # Enable layout save/restore
         nukescripts.registerPanel(NEW_PANEL_ID, add_switch_manager_panel)
         # Legacy ID for saved layouts created before the rename
         nukescripts.registerPanel(LEGACY_PANEL_ID, add_switch_manager_panel)
         # Optional: Nuke menu shortcut
-        nuke.menu('Nuke').addCommand(
-            f'BCN Multishot/{PANEL_NAME}',
-            add_switch_manager_panel,
-        )
-except Exception:
-    pass
+        _bcn_menu.addCommand(PANEL_NAME, add_switch_manager_panel)
+    except Exception:
+        pass
@@ -4,23 +4,104 @@ All functions are defensive and return early when Nuke is not available to
 keep the module import-safe outside Nuke.
 """
 
-from typing import Iterable, List, Optional, Sequence, Dict, Any, Tuple
+import functools
+from typing import Callable, List, Optional, Sequence, Dict, Any, Tuple
 
 try:
     import nuke  # type: ignore
 except Exception:  # pragma: no cover - allow importing outside Nuke
     nuke = None  # type: ignore
 
+# Undo entry point, bound once at import; shared with `render_hooks`.
+_UNDO = getattr(nuke, "Undo", None) if nuke is not None else None
+
+
+# Cached Root GSV knob (plus its bound value accessors); resolved lazily and
+# dropped whenever the script changes.
+_GSV_KNOB = None
+_GSV_GET = None
+_GSV_SET = None
+
+
+def _invalidate_gsv_cache(*_args, **_kwargs) -> None:
+    """Forget the cached Root GSV knob (e.g. after a script load/close)."""
+
+    global _GSV_KNOB, _GSV_GET, _GSV_SET
+    _GSV_KNOB = _GSV_GET = _GSV_SET = None
+
+
+def _install_cache_callbacks() -> None:
+    """Drop the cached knob whenever Nuke swaps the root node."""
+
+    if nuke is None:
+        return
+    for name in ("addOnScriptLoad", "addOnScriptClose"):
+        register = getattr(nuke, name, None)
+        if not callable(register):
+            continue
+        try:
+            register(_invalidate_gsv_cache)
+        except Exception:
+            pass
+
 
 def get_root_gsv_knob():
-    """Return the Root GSV knob (`nuke.Gsv_Knob`) or None if unavailable."""
+    """Return the Root GSV knob (`nuke.Gsv_Knob`) or None if unavailable.
+
+    The knob is cached after the first successful lookup.
+    """
 
+    global _GSV_KNOB, _GSV_GET, _GSV_SET
+    if _GSV_KNOB is not None:
+        return _GSV_KNOB
     if nuke is None:
         return None
     try:
-        return nuke.root()["gsv"]
+        knob = nuke.root()["gsv"]
+        _GSV_GET = knob.getGsvValue
+        _GSV_SET = knob.setGsvValue
     except Exception:
         return None
+    _GSV_KNOB = knob
+    return _GSV_KNOB
+
+
+def _knob_is_stale(knob) -> bool:
+    """Return True when `knob` no longer belongs to the current Root node."""
+
+    try:
+        node = knob.node()
+        return node is None or node != nuke.root()
+    except Exception:
+        # Detached knobs raise on any access.
+        return True
+
+
+def _with_fresh_knob(call: Callable[[Any], Any]) -> Any:
+    """Return `call(gsv)`; if the cached knob turns out stale, re-resolve and retry once.
+
+    The load/close callbacks miss some root swaps (a script opened before this
+    module was imported, `nuke.scriptClear`, a module reload), which would leave
+    a stale cached knob failing every call until the next load. Ordinary API
+    errors on a live knob (missing path, existing set) are raised as-is.
+    """
+
+    gsv = get_root_gsv_knob()
+    if gsv is None:
+        raise LookupError("Root GSV knob is unavailable")
+    try:
+        return call(gsv)
+    except Exception:
+        if not _knob_is_stale(gsv):
+            raise
+        _invalidate_gsv_cache()
+        gsv = get_root_gsv_knob()
+        if gsv is None:
+            raise
+        return call(gsv)
+
+
+_install_cache_callbacks()
 
 
 def ensure_list_datatype(path: str) -> None:
@@ -29,12 +110,13 @@ def ensure_list_datatype(path: str) -> None:
     If unavailable, this is a no-op.
     """
 
-    gsv = get_root_gsv_knob()
-    if gsv is None:
+    if get_root_gsv_knob() is None:
         return
     try:
         # Use fully qualified paths that include the set, e.g. "__default__.screen"
-        gsv.setDataType(path, nuke.gsv.DataType.List)  # type: ignore[attr-defined]
+        _with_fresh_knob(
+            lambda gsv: gsv.setDataType(path, nuke.gsv.DataType.List)  # type: ignore[attr-defined]
+        )
     except Exception:
         pass
 
@@ -42,24 +124,26 @@ def ensure_list_datatype(path: str) -> None:
 def set_list_options(path: str, options: Sequence[str]) -> None:
     """Set list options for a List-type GSV at `path`. No-op on failure."""
 
-    gsv = get_root_gsv_knob()
-    if gsv is None:
+    if get_root_gsv_knob() is None:
         return
+    options = list(options)
     try:
-        gsv.setListOptions(path, list(options))
+        _with_fresh_knob(lambda gsv: gsv.setListOptions(path, options))
     except Exception:
         pass
 
 
 def get_list_options(path: str) -> List[str]:
-    """Get list options for a List-type GSV at `path`. Returns empty on error."""
+    """Get list options for a List-type GSV at `path`.
 
-    gsv = get_root_gsv_knob()
-    if gsv is None:
+    Returns an empty list on error.
+    """
+
+    if get_root_gsv_knob() is None:
         return []
     try:
-        opts = gsv.getListOptions(path)
-        return list(opts) if isinstance(opts, Iterable) else []
+        # `list()` raises TypeError for non-iterables, which lands in the handler.
+        return list(_with_fresh_knob(lambda gsv: gsv.getListOptions(path)))
     except Exception:
         return []
 
@@ -67,11 +151,11 @@ def get_list_options(path: str) -> List[str]:
 def set_value(path: str, value: str) -> None:
     """Set the GSV value at `path`. No-op on failure."""
 
-    gsv = get_root_gsv_knob()
-    if gsv is None:
+    if _GSV_SET is None and get_root_gsv_knob() is None:
         return
     try:
-        gsv.setGsvValue(path, value)
+        # `_GSV_SET` is read at call time, so the retry uses the refreshed accessor.
+        _with_fresh_knob(lambda _gsv: _GSV_SET(path, value))
     except Exception:
         pass
 
@@ -84,17 +168,16 @@ def remove_variant(variant_name: str) -> None:
         return
 
     gsv = get_root_gsv_knob()
-    if gsv is None:
+    if gsv is None or not callable(getattr(gsv, "removeGsv", None)):
         return
 
     try:
-        remove = getattr(gsv, "removeGsv", None)
-        if callable(remove):
-            remove(path)  # type: ignore[arg-type]
+        _with_fresh_knob(lambda gsv: gsv.removeGsv(path))  # type: ignore[arg-type]
     except Exception:
         pass
 
 
+@functools.lru_cache(maxsize=256)
 def _variant_path(variant_name: str) -> Optional[str]:
     """Return the canonical GSV path for a variant name."""
 
@@ -107,15 +190,31 @@ def _variant_path(variant_name: str) -> Optional[str]:
 def _normalized_options(options: Sequence[str]) -> List[str]:
     """Return a deduplicated list of clean option strings (order preserved)."""
 
-    clean: List[str] = []
-    seen = set()
-    for opt in options:
-        text = str(opt).strip()
-        if not text or text in seen:
-            continue
-        seen.add(text)
-        clean.append(text)
-    return clean
+    return [text for text in dict.fromkeys(str(opt).strip() for opt in options) if text]
+
+
+def begin_undo(label: str):
+    """Open a Nuke undo group and return it, or None when unavailable."""
+
+    undo = _UNDO
+    if undo is None:
+        return None
+    try:
+        undo.begin(label)
+    except Exception:
+        return None
+    return undo
+
+
+def end_undo(undo) -> None:
+    """Close an undo group opened by `begin_undo`."""
+
+    if undo is None:
+        return
+    try:
+        undo.end()
+    except Exception:
+        pass
 
 
 def ensure_variant_list(
@@ -133,27 +232,48 @@ def ensure_variant_list(
         Choice that should be selected; falls back to the first option.
     """
 
-    path = _variant_path(variant_name)
-    if path is None:
-        return
+    ensure_variant_lists_bulk({variant_name: (options, default_option)})
 
-    clean_options = _normalized_options(options)
-    if not clean_options:
-        return
 
-    default = default_option if default_option in clean_options else clean_options[0]
+def ensure_variant_lists_bulk(
+    specs: Dict[str, Tuple[Sequence[str], Optional[str]]]
+) -> None:
+    """Ensure several list-type variants exist inside a single undo group.
 
-    try:
-        set_value(path, default)
-    except Exception:
-        pass
+    `specs` maps bare variant names to ``(options, default_option)``. Only
+    selections that differ are written, each to its own path, and the typed
+    calls (`setDataType`, `setListOptions`, `setFavorite`) are only issued for
+    variants whose options changed.
+    """
+
+    pending: List[Tuple[str, List[str], str]] = []
+    for variant_name, (options, default_option) in specs.items():
+        path = _variant_path(variant_name)
+        if path is None:
+            continue
+        clean_options = _normalized_options(options)
+        if not clean_options:
+            continue
+        default = default_option if default_option in clean_options else clean_options[0]
+        pending.append((path, clean_options, default))
+    if not pending or get_root_gsv_knob() is None:
+        return
 
-    ensure_list_datatype(path)
-    set_list_options(path, clean_options)
+    undo = begin_undo("Ensure variant lists")
     try:
-        set_favorite(path, True)
-    except Exception:
-        pass
+        # Per-path writes leave every other set and variable untouched.
+        for path, _options, default in pending:
+            if get_value(path) != default:
+                set_value(path, default)
+
+        for path, clean_options, _default in pending:
+            if get_list_options(path) == clean_options:
+                continue
+            ensure_list_datatype(path)
+            set_list_options(path, clean_options)
+            set_favorite(path, True)
+    finally:
+        end_undo(undo)
 
 
 def get_variant_options(variant_name: str) -> List[str]:
@@ -183,32 +303,53 @@ def get_variant_value(variant_name: str) -> Optional[str]:
     return get_value(path)
 
 
-def discover_list_variants() -> Dict[str, List[str]]:
-    """Return a mapping of variant name -> options for all list-type entries."""
+def _list_variants_in(default_set: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Return variant name -> options for list-type keys of a `__default__` snapshot."""
 
+    gsv = get_root_gsv_knob()
+    if gsv is None:
+        return {}
     variants: Dict[str, List[str]] = {}
-    root_value = get_knob_value()
-    default_set = root_value.get("__default__", {})
+    # Cheap type check so Text/Number variables skip the list-options lookup.
+    get_type = getattr(gsv, "getDataType", None)
+    list_type = getattr(getattr(getattr(nuke, "gsv", None), "DataType", None), "List", None)
+    check_type = callable(get_type) and list_type is not None
     for raw_name in default_set.keys():
         name = str(raw_name)
-        path = _variant_path(name)
-        if path is None:
+        if not name:
             continue
+        # Root keys are already canonical, so skip `_variant_path` here.
+        path = "__default__." + name
+        if check_type:
+            try:
+                if get_type(path) != list_type:
+                    continue
+            except Exception:
+                pass
         options = get_list_options(path)
         if options:
             variants[name] = options
     return variants
 
 
+def discover_list_variants() -> Dict[str, List[str]]:
+    """Return a mapping of variant name -> options for all list-type entries."""
+
+    return _list_variants_in(_get_knob_value_shallow().get("__default__", {}))
+
+
 def get_all_list_variants_with_current() -> Dict[str, Dict[str, Any]]:
-    """Return metadata for each list-type variant (options + current value)."""
+    """Return metadata for each list-type variant (options + current value).
+
+    Current selections come from the same root snapshot used for discovery,
+    so only the option lookups hit the GSV API.
+    """
 
     variants: Dict[str, Dict[str, Any]] = {}
-    discovered = discover_list_variants()
-    for name, options in discovered.items():
-        current = get_variant_value(name)
-        if not current and options:
-            current = options[0]
+    default_set = _get_knob_value_shallow().get("__default__", {})
+    for name, options in _list_variants_in(default_set).items():
+        current = default_set.get(name)
+        current = str(current) if current else options[0]
         variants[name] = {"options": options, "current": current}
     return variants
 
@@ -219,11 +360,12 @@ def set_favorite(path: str, is_favorite: bool = True) -> None:
     No-op on failure or when Nuke is unavailable.
     """
 
-    gsv = get_root_gsv_knob()
-    if gsv is None:
+    if get_root_gsv_knob() is None:
         return
     try:
-        gsv.setFavorite(path, bool(is_favorite))  # type: ignore[attr-defined]
+        _with_fresh_knob(
+            lambda gsv: gsv.setFavorite(path, bool(is_favorite))  # type: ignore[attr-defined]
+        )
     except Exception:
         pass
 
@@ -231,11 +373,10 @@ def set_favorite(path: str, is_favorite: bool = True) -> None:
 def get_value(path: str) -> Optional[str]:
     """Get the GSV value at `path`. Returns None on error."""
 
-    gsv = get_root_gsv_knob()
-    if gsv is None:
+    if _GSV_GET is None and get_root_gsv_knob() is None:
         return None
     try:
-        return gsv.getGsvValue(path)
+        return _with_fresh_knob(lambda _gsv: _GSV_GET(path))
     except Exception:
         return None
 
@@ -246,11 +387,10 @@ def add_set(set_name: str) -> None:
     Uses `gsv.addGsvSet(set_name)`. Safe to call repeatedly.
     """
 
-    gsv = get_root_gsv_knob()
-    if gsv is None:
+    if get_root_gsv_knob() is None:
         return
     try:
-        gsv.addGsvSet(set_name)
+        _with_fresh_knob(lambda gsv: gsv.addGsvSet(set_name))
     except Exception:
         # If it already exists or the API rejects, ignore
         pass
@@ -263,14 +403,30 @@ def get_knob_value() -> Dict[str, Dict[str, str]]:
     Returns an empty mapping on error.
     """
 
-    gsv = get_root_gsv_knob()
-    if gsv is None:
+    if get_root_gsv_knob() is None:
         return {}
     try:
-        val = gsv.value()
+        val = _with_fresh_knob(lambda gsv: gsv.value())
         # Defensive cast
         if isinstance(val, dict):
-            return {str(k): dict(v) for k, v in val.items() if isinstance(v, dict)}
+            return {str(k): {**v} for k, v in val.items() if isinstance(v, dict)}
+        return {}
+    except Exception:
+        return {}
+
+
+def _get_knob_value_shallow() -> Dict[str, Dict[str, str]]:
+    """Return the GSV mapping without copying each set's inner dict.
+
+    Internal helper for callers that immediately write the mapping back.
+    """
+
+    if get_root_gsv_knob() is None:
+        return {}
+    try:
+        val = _with_fresh_knob(lambda gsv: gsv.value())
+        if isinstance(val, dict):
+            return {str(k): v for k, v in val.items() if isinstance(v, dict)}
         return {}
     except Exception:
         return {}
@@ -282,11 +438,10 @@ def set_knob_value(value_map: Dict[str, Dict[str, Any]]) -> None:
     Values are coerced to strings by Nuke where appropriate.
     """
 
-    gsv = get_root_gsv_knob()
-    if gsv is None:
+    if get_root_gsv_knob() is None:
         return
     try:
-        gsv.setValue(value_map)
+        _with_fresh_knob(lambda gsv: gsv.setValue(value_map))
     except Exception:
         pass
 
@@ -298,14 +453,12 @@ def merge_root_value(updates: Dict[str, Dict[str, Any]]) -> None:
         { '__default__': { 'screen': 'Moxy' }, 'Screens': { 'names_csv': 'Moxy,Godzilla' } }
     """
 
-    current = get_knob_value()
+    current = _get_knob_value_shallow()
     # Merge updates
     for set_name, vars_map in updates.items():
         if not isinstance(vars_map, dict):
             continue
-        dst = current.setdefault(set_name, {})
-        for key, val in vars_map.items():
-            dst[key] = val
+        current.setdefault(set_name, {}).update(vars_map)
     set_knob_value(current)
 
 
@@ -315,18 +468,73 @@ def ensure_screen_list(screens: Sequence[str], default_screen: Optional[str] = N
     ensure_variant_list("screens", screens, default_screen)
 
 
-def create_variable_group(name: str):
+def create_variable_group(name: str, existing: Optional[Dict[str, Any]] = None):
     """Create a VariableGroup node with the given name, if possible.
 
+    When `existing` (node name -> node, e.g. from one `nuke.allNodes` scan) is
+    given, a node already listed under `name` is returned instead of creating
+    a duplicate, and newly created nodes are added to it.
     Returns the group node or None.
     """
 
     if nuke is None:
         return None
+    if existing is not None and name in existing:
+        return existing[name]
     try:
-        return nuke.nodes.VariableGroup(name=name)
+        node = nuke.nodes.VariableGroup(name=name)
     except Exception:
         return None
+    if existing is not None:
+        existing[name] = node
+    return node
+
+
+def index_variable_groups() -> Dict[str, Any]:
+    """Return VariableGroup nodes by name from a single `nuke.allNodes` scan."""
+
+    if nuke is None:
+        return {}
+    try:
+        return {node.name(): node for node in nuke.allNodes("VariableGroup")}
+    except Exception:
+        return {}
+
+
+def create_variable_groups(
+    names: Sequence[str],
+    setup: Optional[Callable[[str, Any], None]] = None,
+    label: str = "Create VariableGroups",
+    existing: Optional[Dict[str, Any]] = None,
+) -> List[Any]:
+    """Create (or reuse) one VariableGroup per name inside a single undo group.
+
+    Existing VariableGroups come from `existing` or, when omitted, one
+    `index_variable_groups()` scan, and are reused instead of duplicated.
+    `setup(name, node)` runs for every node while the undo group is still
+    open. Returns the nodes in `names` order.
+    """
+
+    if nuke is None or not names:
+        return []
+    if existing is None:
+        existing = index_variable_groups()
+    nodes: List[Any] = []
+    undo = begin_undo(label)
+    try:
+        for name in names:
+            node = create_variable_group(name, existing)
+            if node is None:
+                continue
+            if setup is not None:
+                try:
+                    setup(name, node)
+                except Exception:
+                    pass
+            nodes.append(node)
+    finally:
+        end_undo(undo)
+    return nodes
 
 
 def ensure_screen_sets(screens: Sequence[str]) -> None:
@@ -336,13 +544,26 @@ def ensure_screen_sets(screens: Sequence[str]) -> None:
 
 
 def ensure_option_sets(option_names: Sequence[str]) -> None:
-    """Ensure there is a GSV set for every provided option name."""
+    """Ensure there is a GSV set for every provided option name.
 
-    for name in _normalized_options(option_names):
-        try:
-            add_set(name)
-        except Exception:
-            pass
+    All sets are added inside one undo group against a single knob lookup.
+    """
+
+    names = _normalized_options(option_names)
+    if not names:
+        return
+    if get_root_gsv_knob() is None:
+        return
+    undo = begin_undo("Ensure option sets")
+    try:
+        for name in names:
+            try:
+                _with_fresh_knob(lambda gsv: gsv.addGsvSet(name))
+            except Exception:
+                # If it already exists or the API rejects, ignore
+                pass
+    finally:
+        end_undo(undo)
 
 
 def get_current_screen() -> Optional[str]:
@@ -358,9 +579,40 @@ def get_value_for_current_screen(key: str) -> Optional[str]:
     `Sphere.<key>`.
     """
 
-    current = get_current_screen()
-    if not current:
+    if _GSV_GET is None and get_root_gsv_knob() is None:
         return None
-    return get_value(f"{current}.{key}")
+    try:
+        current = _with_fresh_knob(lambda _gsv: _GSV_GET("__default__.screens"))
+        return _GSV_GET(current + "." + key) if current else None
+    except Exception:
+        return None
+
+
+# --------------------------------------------------------------------------
+# Outside Nuke every helper would bail out after a knob lookup anyway, so
+# swap in plain no-ops at import time and skip that work entirely.
+def _noop(*_args, **_kwargs) -> None:
+    return None
+
+
+def _noop_list(*_args, **_kwargs) -> List[str]:
+    return []
+
+
+def _noop_dict(*_args, **_kwargs) -> Dict[str, Any]:
+    return {}
 
 
+if nuke is None:  # pragma: no cover - specialisation for non-Nuke imports
+    ensure_list_datatype = set_list_options = set_value = remove_variant = _noop
+    ensure_variant_list = ensure_variant_lists_bulk = set_variant_value = _noop
+    set_favorite = add_set = set_knob_value = merge_root_value = _noop
+    ensure_screen_list = create_variable_group = ensure_screen_sets = _noop
+    ensure_option_sets = _noop
+    create_variable_groups = _noop_list
+    index_variable_groups = _noop_dict
+    get_value = get_variant_value = get_current_screen = _noop
+    get_value_for_current_screen = _noop
+    get_list_options = get_variant_options = _noop_list
+    get_knob_value = _get_knob_value_shallow = _noop_dict
+    discover_list_variants = get_all_list_variants_with_current = _noop_dict
@@ -25,6 +25,15 @@ except Exception:  # pragma: no cover
     nuke = None  # type: ignore
 
 
+# Expression template for `set_knob_expression_for_screen_field`; `%r` receives
+# the ".<field>" suffix. The expression stays self-contained so saved scripts
+# evaluate without this toolset on the path (e.g. on the render farm).
+_SCREEN_FIELD_TEMPLATE = (
+    "python {g=nuke.root()['gsv']; s=g.getGsvValue('__default__.screens'); "
+    "g.getGsvValue(s + %r)}"
+)
+
+
 def set_knob_expression_from_gsv(node: "nuke.Node", knob_name: str, gsv_path: str) -> None:  # type: ignore[name-defined]
     """Inject a python expression to read a value from a GSV path.
 
@@ -52,11 +61,8 @@ def set_knob_expression_for_screen_field(node: "nuke.Node", knob_name: str, fiel
     if nuke is None or node is None:
         return
     try:
-        expr = (
-            "python {g=nuke.root()['gsv']; s=g.getGsvValue('__default__.screens'); "
-            f"g.getGsvValue(s + '.{field}')}"  # field is literal in the expression
-        )
-        node[knob_name].setExpression(expr)
+        # `%r` quotes the field, so quote-bearing names cannot break the expression.
+        node[knob_name].setExpression(_SCREEN_FIELD_TEMPLATE % ("." + field))
     except Exception:
         pass
 
@@ -7,35 +7,32 @@ For the current workflow we only need a lightweight helper that:
   - sets a readable label (`[value gsv]`) so artists can see the scope
   - forces the group's variant values (e.g. `__default__.screens`) to match the panel's pick
 """
-from typing import Dict, Optional
+import contextlib
+import importlib
+from typing import Dict, Iterator, List, Optional, Sequence
 
 try:  # pragma: no cover - Nuke runtime provides the real module
     import nuke  # type: ignore
 except Exception:  # pragma: no cover
     nuke = None  # type: ignore
 
+# Stable Nuke entry point, bound once at import.
+_TPRINT = getattr(nuke, "tprint", None) if nuke is not None else None
+
 try:
     from . import gsv_utils  # type: ignore
 except Exception:  # pragma: no cover - fallback when loaded as loose modules
     import gsv_utils  # type: ignore
 
-try:
-    from . import switch_manager  # type: ignore
-except Exception:  # pragma: no cover
-    try:
-        import switch_manager  # type: ignore
-    except Exception:  # pragma: no cover
-        switch_manager = None  # type: ignore
+# Panel module, imported on first use (it imports this module in turn).
+_PANEL_MODULE = None
+_PANEL_MODULE_RESOLVED = False
 
-# Legacy fallback when the module has not been renamed yet.
-if switch_manager is None:  # pragma: no cover - compatibility shim
-    try:
-        from . import screens_manager as switch_manager  # type: ignore
-    except Exception:
-        try:
-            import screens_manager as switch_manager  # type: ignore
-        except Exception:
-            switch_manager = None  # type: ignore
+# Node classes that can be wrapped in a VariableGroup.
+_SUPPORTED_TARGET_CLASSES = frozenset({"Write", "Group"})
+# Label and tile colour applied to wrapper VariableGroups.
+_VG_LABEL = "[value gsv]"
+_VG_TILE_COLOR = 3383053311
 
 
 def _log_exception(context: str, exc: Exception) -> None:
@@ -43,8 +40,8 @@ def _log_exception(context: str, exc: Exception) -> None:
 
     message = f"[render_hooks] {context}: {exc}"
     try:
-        if nuke is not None and hasattr(nuke, "tprint"):
-            nuke.tprint(message)  # type: ignore[attr-defined]
+        if _TPRINT is not None:
+            _TPRINT(message)
         else:
             print(message)  # noqa: T201
     except Exception:
@@ -52,18 +49,55 @@ def _log_exception(context: str, exc: Exception) -> None:
         print(message)  # noqa: T201
 
 
+# Resolved Switch Manager panel class; cleared by `invalidate_panel_cache`.
+_PANEL_CLS = None
+
+
+def invalidate_panel_cache() -> None:
+    """Forget the cached panel class (e.g. after `switch_manager` is reloaded)."""
+
+    global _PANEL_CLS
+    _PANEL_CLS = None
+
+
+def _load_panel_module():
+    """Import the Switch Manager module once, falling back to the legacy shim."""
+
+    global _PANEL_MODULE, _PANEL_MODULE_RESOLVED
+    if _PANEL_MODULE_RESOLVED:
+        return _PANEL_MODULE
+    for name in ("switch_manager", "screens_manager"):
+        # Package-relative first, then as a loose module on NUKE_PATH.
+        candidates = (f"{__package__}.{name}", name) if __package__ else (name,)
+        for qualified in candidates:
+            try:
+                _PANEL_MODULE = importlib.import_module(qualified)
+            except Exception:
+                continue
+            _PANEL_MODULE_RESOLVED = True
+            return _PANEL_MODULE
+    _PANEL_MODULE_RESOLVED = True
+    return None
+
+
+def _panel_class():
+    """Return the Switch Manager panel class, resolving it once."""
+
+    global _PANEL_CLS
+    if _PANEL_CLS is None:
+        panel_module = _load_panel_module()
+        # Prefer the renamed SwitchManagerPanel class, but fall back gracefully.
+        _PANEL_CLS = getattr(panel_module, "SwitchManagerPanel", None) or getattr(
+            panel_module, "ScreensManagerPanel", None
+        )
+    return _PANEL_CLS
+
+
 def _panel_variant_values() -> Dict[str, str]:
     """Return active variant selections from the Switch Manager UI."""
 
-    panel_module = switch_manager
-    if panel_module is None:
-        return {}
-
-    # Prefer the renamed SwitchManagerPanel class, but fall back gracefully.
-    panel_cls = getattr(panel_module, "SwitchManagerPanel", None) or getattr(
-        panel_module, "ScreensManagerPanel", None
-    )
-    inst = getattr(panel_cls, "instance", None) if panel_cls else None
+    # `instance` is read fresh so a re-created panel is always picked up.
+    inst = getattr(_panel_class(), "instance", None)
     if inst is None:
         return {}
 
@@ -87,34 +121,62 @@ def _panel_variant_values() -> Dict[str, str]:
     return {"screens": value} if value else {}
 
 
+# Variant values resolved inside an open `_variant_cache_scope` (None otherwise).
+_VARIANT_CACHE: Optional[Dict[str, str]] = None
+_VARIANT_SCOPE_DEPTH = 0
+
+
+def invalidate_variant_cache() -> None:
+    """Drop memoized variant values so the next lookup re-reads panel + GSV."""
+
+    global _VARIANT_CACHE
+    _VARIANT_CACHE = None
+
+
+@contextlib.contextmanager
+def _variant_cache_scope() -> Iterator[None]:
+    """Memoize `_resolved_variant_values` until the outermost scope exits."""
+
+    global _VARIANT_SCOPE_DEPTH
+    _VARIANT_SCOPE_DEPTH += 1
+    try:
+        yield
+    finally:
+        _VARIANT_SCOPE_DEPTH -= 1
+        if _VARIANT_SCOPE_DEPTH == 0:
+            invalidate_variant_cache()
+
+
 def _resolved_variant_values() -> Dict[str, str]:
     """Merge panel selections with current GSV values for each list-type variant."""
 
-    resolved = {k: v for k, v in _panel_variant_values().items() if v}
+    global _VARIANT_CACHE
+    if _VARIANT_CACHE is not None:
+        return _VARIANT_CACHE
 
     discovered = gsv_utils.get_all_list_variants_with_current()
-    for name, payload in discovered.items():
-        current = payload.get("current")
-        if name not in resolved and current:
-            resolved[name] = str(current)
+    gsv_values = {
+        name: str(payload["current"])
+        for name, payload in discovered.items()
+        if payload.get("current")
+    }
+    # Panel selections win over the values stored on the root GSV.
+    resolved = gsv_values | {k: v for k, v in _panel_variant_values().items() if v}
 
     if not resolved:
         fallback = gsv_utils.get_current_screen()
         if fallback:
             resolved["screens"] = fallback
+    if _VARIANT_SCOPE_DEPTH:
+        _VARIANT_CACHE = resolved
     return resolved
 
 
 def _node_name(node: object) -> str:
     try:
-        name_attr = getattr(node, "name", None)
-        if callable(name_attr):
-            return str(name_attr())
-        if name_attr:
-            return str(name_attr)
+        return str(node.name()) or "Node"  # type: ignore[attr-defined]
     except Exception:
-        pass
-    return "Node"
+        return "Node"
 
 
 def _position_group(group: object, target: object) -> None:
@@ -125,21 +187,12 @@ def _position_group(group: object, target: object) -> None:
         ty = int(target["ypos"].value())
         group["xpos"].setValue(tx)
 
-        upstream = None
-        try:
-            upstream = target.input(0)
-        except Exception:
-            upstream = None
-
-        if upstream is not None:
-            try:
-                uy = int(upstream["ypos"].value())
-                group["ypos"].setValue(int((ty + uy) / 2))
-                return
-            except Exception:
-                pass
-
-        group["ypos"].setValue(ty)
+        upstream = target.input(0) if hasattr(target, "input") else None
+        ypos_knob = upstream.knob("ypos") if upstream is not None else None
+        if ypos_knob is not None:
+            group["ypos"].setValue(int((ty + int(ypos_knob.value())) / 2))
+        else:
+            group["ypos"].setValue(ty)
     except Exception:
         pass
 
@@ -147,19 +200,43 @@ def _position_group(group: object, target: object) -> None:
 def _rewire_primary_input(group: object, target: object) -> None:
     """Insert the VariableGroup between the target and its primary input."""
 
-    upstream = None
+    if not (hasattr(target, "input") and hasattr(group, "setInput")):
+        return
     try:
-        upstream = target.input(0)
+        group.setInput(0, target.input(0))
+        target.setInput(0, group)
     except Exception:
-        upstream = None
+        pass
+
+
+def _group_has_wired_terminals(group: object) -> bool:
+    """Return True when the group already holds an Input feeding an Output.
+
+    Recent VariableGroups ship with Input1/Output1; `group.nodes()` lets us
+    check that without entering the group's context.
+    """
+
     try:
-        group.setInput(0, upstream)
+        children = group.nodes()  # type: ignore[attr-defined]
     except Exception:
-        pass
+        return False
+    have_input = False
+    output = None
+    for child in children:
+        try:
+            cls = child.Class()
+        except Exception:
+            continue
+        if cls == "Input":
+            have_input = True
+        elif cls == "Output" and output is None:
+            output = child
+    if not have_input or output is None:
+        return False
     try:
-        target.setInput(0, group)
+        return output.input(0) is not None
     except Exception:
-        pass
+        return False
 
 
 def _ensure_group_terminals(group: object) -> None:
@@ -167,17 +244,23 @@ def _ensure_group_terminals(group: object) -> None:
 
     if nuke is None:
         return
+    if _group_has_wired_terminals(group):
+        return
     try:
         # Explicitly enter the group's context; VariableGroup may not support a context manager
         group.begin()
         try:
-            nodes = list(nuke.allNodes())
-            input_nodes = [node for node in nodes if node.Class() == "Input"]
-            output_nodes = [node for node in nodes if node.Class() == "Output"]
-
-            if input_nodes:
-                inp = input_nodes[0]
-            else:
+            inp = out = None
+            for node in nuke.allNodes(recurse=False):
+                cls = node.Class()
+                if cls == "Input" and inp is None:
+                    inp = node
+                elif cls == "Output" and out is None:
+                    out = node
+                if inp is not None and out is not None:
+                    break
+
+            if inp is None:
                 try:
                     # create Input inside the group
                     inp = nuke.nodes.Input()
@@ -190,9 +273,7 @@ def _ensure_group_terminals(group: object) -> None:
             except Exception as exc:
                 _log_exception("rename Input node", exc)
 
-            if output_nodes:
-                out = output_nodes[0]
-            else:
+            if out is None:
                 try:
                     # create Output inside the group
                     out = nuke.nodes.Output()
@@ -220,7 +301,7 @@ def _ensure_group_terminals(group: object) -> None:
 
 def _set_group_label(group: object) -> None:
     try:
-        group["label"].setValue("[value gsv]")
+        group["label"].setValue(_VG_LABEL)
     except Exception:
         pass
 
@@ -253,17 +334,16 @@ def _set_group_tile_color(group: object) -> None:
     """Apply a distinctive tile color to VariableGroups created via the wrap helper."""
 
     try:
-        group["tile_color"].setValue(3383053311)
+        group["tile_color"].setValue(_VG_TILE_COLOR)
     except Exception:
         pass
 
 
 def _supported_target(node: object) -> bool:
     try:
-        cls = node.Class()
+        return node.Class() in _SUPPORTED_TARGET_CLASSES
     except Exception:
         return False
-    return cls in {"Write", "Group"}
 
 
 def _selected_target(node: Optional[object]) -> Optional[object]:
@@ -278,6 +358,68 @@ def _selected_target(node: Optional[object]) -> Optional[object]:
         return None
 
 
+def _existing_wrapper(target: object) -> Optional[object]:
+    """Return the wrapper VariableGroup already feeding `target`, if any.
+
+    Only groups carrying the wrapper label count, so artist-built
+    VariableGroups upstream of a Write are never treated as wrappers.
+    """
+
+    try:
+        upstream = target.input(0)  # type: ignore[attr-defined]
+        if upstream is None or upstream.Class() != "VariableGroup":
+            return None
+        label = upstream.knob("label")
+        if label is None or label.value() != _VG_LABEL:
+            return None
+    except Exception:
+        return None
+    return upstream
+
+
+def _encapsulate_target(target: object, show_panel: bool = True) -> Optional[object]:
+    """Create, wire and configure the VariableGroup for a single target.
+
+    Targets that are already wrapped only get their variant values refreshed,
+    leaving the DAG untouched.
+    """
+
+    group = _existing_wrapper(target)
+    if group is not None:
+        _set_group_variants(group)
+        if show_panel:
+            try:
+                group.showControlPanel()
+            except Exception:
+                pass
+        return group
+
+    try:
+        group = nuke.nodes.VariableGroup()
+    except Exception:
+        nuke.message("Unable to create VariableGroup node")
+        return None
+
+    try:
+        group.setName(nuke.uniqueName(f"{_node_name(target)}_VG"))
+    except Exception:
+        pass
+
+    _ensure_group_terminals(group)
+    _position_group(group, target)
+    _rewire_primary_input(group, target)
+    _set_group_label(group)
+    _set_group_variants(group)
+    _set_group_tile_color(group)
+
+    if show_panel:
+        try:
+            group.showControlPanel()
+        except Exception:
+            pass
+    return group
+
+
 def encapsulate_write_with_variable_group(node: Optional[object] = None) -> Optional[object]:
     """Insert a VariableGroup upstream of the selected Write/Group."""
 
@@ -291,43 +433,50 @@ def encapsulate_write_with_variable_group(node: Optional[object] = None) -> Opti
         nuke.message("Select a Write node or Group")
         return None
 
-    undo = getattr(nuke, "Undo", None)
-    if undo is not None:
-        try:
-            undo.begin("Insert VariableGroup for screens")
-        except Exception:
-            undo = None
-
+    undo = gsv_utils.begin_undo("Insert VariableGroup for screens")
     try:
-        try:
-            group = nuke.nodes.VariableGroup()
-        except Exception:
-            nuke.message("Unable to create VariableGroup node")
-            return None
+        with _variant_cache_scope():
+            return _encapsulate_target(target)
+    finally:
+        gsv_utils.end_undo(undo)
+
 
+def encapsulate_writes(targets: Optional[Sequence[object]] = None) -> List[object]:
+    """Insert a VariableGroup upstream of each Write/Group in `targets`.
+
+    Defaults to the current selection. The batch shares one undo step and one
+    variant lookup, and only the last group's control panel is opened.
+    """
+
+    if nuke is None:
+        return []
+    if targets is None:
         try:
-            group.setName(nuke.uniqueName(f"{_node_name(target)}_VG"))
+            targets = nuke.selectedNodes()  # type: ignore[attr-defined]
         except Exception:
-            pass
+            targets = []
+    supported = [target for target in targets if _supported_target(target)]
+    if not supported:
+        nuke.message("Select a Write node or Group")
+        return []
 
-        _ensure_group_terminals(group)
-        _position_group(group, target)
-        _rewire_primary_input(group, target)
-        _set_group_label(group)
-        _set_group_variants(group)
-        _set_group_tile_color(group)
+    groups: List[object] = []
+    undo = gsv_utils.begin_undo("Insert VariableGroups for screens")
+    try:
+        with _variant_cache_scope():
+            for target in supported:
+                group = _encapsulate_target(target, show_panel=False)
+                if group is not None:
+                    groups.append(group)
+    finally:
+        gsv_utils.end_undo(undo)
 
+    if groups:
         try:
-            group.showControlPanel()
+            groups[-1].showControlPanel()
         except Exception:
             pass
-        return group
-    finally:
-        if undo is not None:
-            try:
-                undo.end()
-            except Exception:
-                pass
+    return groups
 
 
-__all__ = ["encapsulate_write_with_variable_group"]
+__all__ = ["encapsulate_write_with_variable_group", "encapsulate_writes"]
@@ -7,8 +7,14 @@ like building VariableGroups or creating VariableSwitch previews.
 """
 from __future__ import annotations
 
-from typing import Callable, Dict, List, Optional, Sequence
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import contextlib
+import functools
+import itertools
 import os
+import re
+import sys
+import weakref
 
 try:
     import nuke  # type: ignore
@@ -35,7 +41,10 @@ except Exception:  # pragma: no cover
             QtWidgets = None  # type: ignore
             QtGui = None  # type: ignore
 
-import gsv_utils
+try:
+    from . import gsv_utils  # type: ignore
+except Exception:  # pragma: no cover - fallback when loaded as loose modules
+    import gsv_utils  # type: ignore
 
 try:
     from . import render_hooks  # type: ignore
@@ -47,6 +56,23 @@ except Exception:  # pragma: no cover
 
 SWITCH_TILE_COLOR = 7012351
 
+# Anything outside letters, digits, underscore and hyphen is stripped from
+# variant/option names (`\w` keeps parity with the previous `str.isalnum` filter).
+_INVALID_NAME_CHARS_RE = re.compile(r"[^\w-]+")
+# Node names additionally reject hyphens; map them to underscores up front.
+_INVALID_NODE_NAME_CHARS_RE = re.compile(r"\W")
+
+
+@functools.lru_cache(maxsize=256)
+def _sanitize_token(text: str) -> str:
+    """Return `text` stripped of characters invalid in variant/option names.
+
+    Row and variant texts repeat between keystrokes and refreshes, so results
+    are memoized.
+    """
+
+    return _INVALID_NAME_CHARS_RE.sub("", text.strip())
+
 
 def _noop_callback() -> None:
     """Return a no-op callback."""
@@ -54,6 +80,196 @@ def _noop_callback() -> None:
     return
 
 
+@contextlib.contextmanager
+def _blocked(widget, block: bool = True) -> Iterator[None]:
+    """Silence `widget` signals for the block, restoring the prior state.
+
+    Works the same on PySide2 and PySide6, unlike `QSignalBlocker`'s context
+    manager support.
+    """
+
+    if not block:
+        yield
+        return
+    previous = widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        widget.blockSignals(previous)
+
+
+@contextlib.contextmanager
+def _updates_suspended(widget) -> Iterator[None]:
+    """Hold repaints of `widget` during bulk child changes; repaint once after."""
+
+    if not widget.updatesEnabled():
+        yield
+        return
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+# Bumped whenever the root GSV may have changed; keys `_cached_list_variants`.
+# The cache is only trusted once the GSV change callback is installed.
+_GSV_EPOCH = 0
+_GSV_CALLBACK_ACTIVE = False
+
+
+def _bump_gsv_epoch(*_args, **_kwargs) -> None:
+    """Mark previously read GSV list variants as stale."""
+
+    global _GSV_EPOCH
+    _GSV_EPOCH += 1
+
+
+# Marker set on `nuke.callbacks` once the GSV handlers below are registered.
+# It lives outside this module so a reload does not register them again.
+_GSV_DISPATCH_MARKER = "_switch_manager_gsv_dispatch_installed"
+
+
+def _live_module():
+    """Return the current incarnation of this module (survives reloads)."""
+
+    return sys.modules.get(__name__)
+
+
+def _dispatch_gsv_change(*_args, **_kwargs) -> None:
+    """Process-wide GSV change handler: invalidate reads, reload the live panel."""
+
+    module = _live_module()
+    if module is None:
+        return
+    module._bump_gsv_epoch()
+    inst = getattr(getattr(module, "SwitchManagerPanel", None), "instance", None)
+    if inst is None:
+        return
+    try:
+        inst._schedule_gsv_reload()
+    except Exception:
+        pass
+
+
+def _dispatch_root_knob_changed(*_args, **_kwargs) -> None:
+    """Root knobChanged handler: edits made in the GSV knob UI skip onGsvSetChanged."""
+
+    try:
+        knob = nuke.thisKnob()
+        if knob is None or knob.name() != "gsv":
+            return
+    except Exception:
+        return
+    module = _live_module()
+    if module is not None:
+        module._dispatch_gsv_change()
+
+
+def _dispatch_script_change(*_args, **_kwargs) -> None:
+    """Script load/close handler: a new script replaces the root GSV wholesale."""
+
+    module = _live_module()
+    if module is not None:
+        module._bump_gsv_epoch()
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_list_variants(epoch: int) -> Dict[str, List[str]]:
+    """Return `discover_list_variants()` memoized per GSV epoch."""
+
+    return gsv_utils.discover_list_variants()
+
+
+def _list_variants() -> Dict[str, List[str]]:
+    """Return the root GSV list variants, reusing reads until the GSV changes.
+
+    Callers get their own copy, so the memoized mapping is never mutated.
+    """
+
+    if not _GSV_CALLBACK_ACTIVE:
+        return gsv_utils.discover_list_variants()
+    cached = _cached_list_variants(_GSV_EPOCH)
+    return {name: list(options) for name, options in cached.items()}
+
+
+# Action button colours per `smRole`: (normal, pressed).
+_ACTION_BUTTON_PALETTE = {
+    "primary": ("#2f7bf2", "#2462c1"),
+    "accent": ("#a68a00", "#2f7c55"),
+    "secondary": ("#3a3f4b", "#2b2f38"),
+}
+_ACTION_BUTTON_QSS_TEMPLATE = """
+QPushButton[smRole="{role}"] {{
+    background-color: {normal};
+    border: 1px solid rgba(255,255,255,0.08);
+    border-radius: 6px;
+    padding: 6px 10px;
+    color: #f5f5f5;
+    font-weight: 500;
+}}
+QPushButton[smRole="{role}"]:hover {{
+    border-color: rgba(255,255,255,0.2);
+}}
+QPushButton[smRole="{role}"]:pressed {{
+    background-color: {pressed};
+}}
+"""
+# Installed once on the panel; buttons only carry their `smRole` property.
+_ACTION_BUTTON_QSS = "".join(
+    _ACTION_BUTTON_QSS_TEMPLATE.format(role=role, normal=normal, pressed=pressed)
+    for role, (normal, pressed) in _ACTION_BUTTON_PALETTE.items()
+)
+
+
+# Live panels by object name, so the legacy UI helpers can reach them without
+# walking the whole Qt widget tree. `importlib.reload` re-runs this module in
+# its existing namespace, so the registry (and panels built before a reload)
+# carries over.
+_PANEL_REGISTRY: "weakref.WeakValueDictionary" = globals().get("_PANEL_REGISTRY")
+if _PANEL_REGISTRY is None:
+    _PANEL_REGISTRY = weakref.WeakValueDictionary()
+
+
+# Decoded header logo, shared by every panel instance.
+_LOGO_PIXMAP = None
+_LOGO_LOADED = False
+
+
+def _load_logo_once():
+    """Return the branded logo QPixmap, reading it from disk only once."""
+
+    global _LOGO_PIXMAP, _LOGO_LOADED
+    if _LOGO_LOADED or QtGui is None:
+        return _LOGO_PIXMAP
+    _LOGO_LOADED = True
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = os.path.join(root_dir, "switch_manager_logo_alpha.png")
+    if os.path.exists(path):
+        _LOGO_PIXMAP = QtGui.QPixmap(path)
+    return _LOGO_PIXMAP
+
+
+# Smoothly scaled logos keyed by height; heights are quantized to this step so
+# the cache stays tiny across the header's 72-128px range.
+_LOGO_HEIGHT_STEP = 8
+_LOGO_SCALED: Dict[int, object] = {}
+
+
+def _scaled_logo(height: int):
+    """Return the logo scaled to `height` (rounded to the step), or None."""
+
+    height = max(_LOGO_HEIGHT_STEP, round(height / _LOGO_HEIGHT_STEP) * _LOGO_HEIGHT_STEP)
+    scaled = _LOGO_SCALED.get(height)
+    if scaled is None:
+        pixmap = _load_logo_once()
+        if pixmap is None or pixmap.isNull():
+            return None
+        scaled = pixmap.scaledToHeight(height, QtCore.Qt.SmoothTransformation)
+        _LOGO_SCALED[height] = scaled
+    return scaled
+
+
 if QtWidgets is None:
 
     class SwitchManagerPanel(object):  # type: ignore[misc]
@@ -79,11 +295,32 @@ else:
             current_value: Optional[str] = None,
             locked: bool = False,
             parent: Optional[QtWidgets.QWidget] = None,
+            selection_callback: Optional[Callable[[], None]] = None,
         ) -> None:
             super().__init__(parent)
             self._change_callback = change_callback or _noop_callback
             self._remove_callback = remove_callback
+            self._selection_callback = selection_callback or _noop_callback
             self._locked = False
+            # Combo text -> index, mirrored in `_set_combo_items` for O(1) lookups.
+            self._combo_index: Dict[str, int] = {}
+            # Row widgets in layout order, mirrored so row walks stay in Python.
+            self._rows: List[QtWidgets.QWidget] = []
+            # Sanitized options from the rows; dropped whenever a row is
+            # added, removed or its text changes.
+            self._options_cache: Optional[Tuple[str, ...]] = None
+            # Typing in an option row restarts this timer so the combo, summary
+            # and chip refresh runs once per pause rather than per keystroke.
+            self._refresh_timer = QtCore.QTimer(self)
+            self._refresh_timer.setSingleShot(True)
+            self._refresh_timer.setInterval(150)
+            self._refresh_timer.timeout.connect(self._refresh_from_rows)
+            # Structural row changes (add/remove) refresh on the next event-loop
+            # pass, so several in one turn collapse into a single refresh.
+            self._rows_changed_timer = QtCore.QTimer(self)
+            self._rows_changed_timer.setSingleShot(True)
+            self._rows_changed_timer.setInterval(0)
+            self._rows_changed_timer.timeout.connect(self._refresh_from_rows)
             self._screen_name_regex = None
             if QtCore is not None and hasattr(QtCore, "QRegularExpression"):
                 try:
@@ -92,7 +329,7 @@ else:
                     self._screen_name_regex = None
             self._build_ui()
             self.set_variant_name(variant_name, emit_signal=False)
-            self.set_options(options or [], current_value, emit_signal=False)
+            self.set_options(options or [], current_value)
             self.set_locked(locked)
 
         # ------------------------------------------------------------------ UI
@@ -133,7 +370,9 @@ else:
                 "Active option for this variant. Changing this writes directly to the GSV "
                 "value without altering the variant's options."
             )
-            self.current_combo.currentTextChanged.connect(self._on_default_changed)
+            # `activated` only fires for user picks, so programmatic selection
+            # changes never write back to the GSV and need no signal blocking.
+            self.current_combo.activated.connect(self._on_current_activated)
             # Style the current-selection combo as a primary, high-visibility control.
             self.current_combo.setStyleSheet(
                 """
@@ -158,7 +397,7 @@ else:
             self.remove_btn.setText("✕")
             self.remove_btn.setAutoRaise(True)
             self.remove_btn.setToolTip("Remove this variant section.")
-            self.remove_btn.clicked.connect(lambda *_: self._remove_callback(self))
+            self.remove_btn.clicked.connect(self._on_remove_clicked)
             header.addWidget(self.remove_btn, 0)
 
             layout.addLayout(header)
@@ -183,9 +422,25 @@ else:
             body_layout.addWidget(self.summary_label)
 
             chip_container = QtWidgets.QWidget(self.body)
+            # One stylesheet for every chip, selected by the `smChip` property
+            # (as `smRole` does for the action buttons).
+            chip_container.setStyleSheet(
+                'QLabel[smChip="true"] { background-color: #2f3542; border-radius: 10px; '
+                "padding: 4px 10px; color: #f0f6ff; }"
+            )
             self.chip_layout = QtWidgets.QHBoxLayout(chip_container)
             self.chip_layout.setContentsMargins(0, 0, 0, 0)
             self.chip_layout.setSpacing(6)
+            # Permanent empty-state label, shown instead of chips when there
+            # are no options; it always sits at index 0, ahead of the chips.
+            self._chip_placeholder = QtWidgets.QLabel("Add options to preview them here.", chip_container)
+            self._chip_placeholder.setStyleSheet("color: #6c788d;")
+            self.chip_layout.addWidget(self._chip_placeholder)
+            self.chip_layout.addStretch(1)
+            # Chip labels are pooled and reused by `_render_chips`.
+            self._chip_widgets: List[QtWidgets.QLabel] = []
+            # Options shown by the chips; None until the first render.
+            self._last_chip_options: Optional[Tuple[str, ...]] = None
             body_layout.addWidget(chip_container)
 
             button_row = QtWidgets.QHBoxLayout()
@@ -218,17 +473,27 @@ else:
         def collect_options(self) -> List[str]:
             """Return sanitized option names from the row editors."""
 
-            options: List[str] = []
-            seen = set()
-            for row in self._iter_rows():
-                edit = getattr(row, "line_edit", None)
-                if not isinstance(edit, QtWidgets.QLineEdit):
-                    continue
-                name = self._sanitize_option(edit.text())
-                if name and name not in seen:
-                    seen.add(name)
-                    options.append(name)
-            return options
+            if self._options_cache is None:
+                edits = (getattr(row, "line_edit", None) for row in self._iter_rows())
+                # Sanitize, drop blanks and dedupe (order-preserving) in one pass.
+                self._options_cache = tuple(
+                    dict.fromkeys(
+                        filter(
+                            None,
+                            (
+                                self._sanitize_option(edit.text())
+                                for edit in edits
+                                if isinstance(edit, QtWidgets.QLineEdit)
+                            ),
+                        )
+                    )
+                )
+            return list(self._options_cache)
+
+        def _invalidate_options(self, *_args) -> None:
+            """Forget the cached `collect_options` result."""
+
+            self._options_cache = None
 
         def current_selection(self) -> Optional[str]:
             """Return the active combo selection or fallback to first option."""
@@ -246,40 +511,56 @@ else:
             """Programmatically update the variant name."""
 
             clean = self._sanitize_name(text)
-            if not emit_signal:
-                self.variant_edit.blockSignals(True)
-            self.variant_edit.setText(clean)
-            if not emit_signal:
-                self.variant_edit.blockSignals(False)
+            with _blocked(self.variant_edit, not emit_signal):
+                self.variant_edit.setText(clean)
 
         def set_options(
             self,
             options: Sequence[str],
             current_value: Optional[str] = None,
-            emit_signal: bool = True,
         ) -> None:
-            """Rebuild the option rows and combo box."""
+            """Rebuild the option rows and combo box.
+
+            Existing row widgets are reused for the new texts; rows are only
+            created for the shortfall and deleted for the surplus.
+            """
 
             options = list(options)
+            # An empty variant still shows the two blank starter rows.
+            texts = options or ["", ""]
+            rows = self._iter_rows()
             self._rows_updating = True
             try:
-                for row in self._iter_rows():
+                for row in rows[len(texts):]:
                     self.rows_layout.removeWidget(row)
                     row.deleteLater()
-                if options:
-                    for name in options:
-                        self._add_row(name, emit_change=False)
-                else:
-                    self._ensure_minimum_rows()
+                del self._rows[len(texts):]
+                for row, text in zip(rows, texts):
+                    edit = getattr(row, "line_edit", None)
+                    if isinstance(edit, QtWidgets.QLineEdit):
+                        edit.setText(self._sanitize_option(text))
+                for text in texts[len(rows):]:
+                    self._add_row(text, emit_change=False)
+                self._invalidate_options()
             finally:
                 self._rows_updating = False
 
-            if not options:
-                self._ensure_minimum_rows()
-
             current_options = self.collect_options()
             self._refresh_from_rows()
-            self._set_combo_items(current_options, current_value, emit_signal=emit_signal)
+            self._set_combo_items(current_options, current_value)
+
+        def set_current_value(self, value: Optional[str]) -> None:
+            """Select `value` in the combo without rebuilding it or writing GSV."""
+
+            if not value:
+                return
+            idx = self._combo_index.get(value, -1)
+            if idx < 0 or idx == self.current_combo.currentIndex():
+                return
+            self.current_combo.setCurrentIndex(idx)
+            # Programmatic index changes emit no `activated`; drop the panel's
+            # cached selections here so they cannot go stale.
+            self._selection_callback()
 
         def is_syncable(self) -> bool:
             """Return True when the variant contains enough data to sync to GSV."""
@@ -315,21 +596,13 @@ else:
 
             if hasattr(self, "_rows_updating") and self._rows_updating:
                 return
-            for _ in range(max(0, 2 - self.rows_layout.count())):
+            for _ in range(max(0, 2 - len(self._rows))):
                 self._add_row("", emit_change=False)
 
         def _iter_rows(self) -> List[QtWidgets.QWidget]:
-            """Yield all row widgets currently in the layout."""
+            """Return all row widgets in layout order (a copy of `_rows`)."""
 
-            rows: List[QtWidgets.QWidget] = []
-            for idx in range(self.rows_layout.count()):
-                item = self.rows_layout.itemAt(idx)
-                if item is None:
-                    continue
-                widget = item.widget()
-                if widget is not None:
-                    rows.append(widget)
-            return rows
+            return list(self._rows)
 
         def _add_row(
             self,
@@ -347,6 +620,7 @@ else:
             edit = QtWidgets.QLineEdit(row)
             edit.setPlaceholderText("Option name")
             edit.setObjectName("switchVariantRow")
+            validated = False
             if (
                 QtGui is not None
                 and hasattr(QtGui, "QRegularExpressionValidator")
@@ -355,23 +629,33 @@ else:
                 try:
                     validator = QtGui.QRegularExpressionValidator(self._screen_name_regex, edit)
                     edit.setValidator(validator)
+                    validated = True
                 except Exception:
                     pass
-            edit.textEdited.connect(lambda text, editor=edit: self._sanitize_entry(editor, text))
+            if validated:
+                # The validator already rejects invalid characters inside Qt;
+                # only the (debounced) preview refresh is left to schedule.
+                edit.textEdited.connect(self._schedule_refresh)
+            else:
+                edit.textEdited.connect(self._on_row_text_edited)
+            edit.editingFinished.connect(self._flush_refresh)
+            edit.textChanged.connect(self._invalidate_options)
 
             add_btn = QtWidgets.QToolButton(row)
             add_btn.setText("+")
             add_btn.setToolTip("Add a new option row below.")
             add_btn.setFixedSize(24, 24)
             add_btn.setAutoRaise(True)
-            add_btn.clicked.connect(lambda *_args, r=row: self._add_row(insert_after=r))
+            setattr(add_btn, "row", row)
+            add_btn.clicked.connect(self._on_add_row_clicked)
 
             remove_btn = QtWidgets.QToolButton(row)
             remove_btn.setText("-")
             remove_btn.setToolTip("Remove this option row.")
             remove_btn.setFixedSize(24, 24)
             remove_btn.setAutoRaise(True)
-            remove_btn.clicked.connect(lambda *_args, r=row: self._remove_row(r))
+            setattr(remove_btn, "row", row)
+            remove_btn.clicked.connect(self._on_remove_row_clicked)
 
             row_layout.addWidget(edit, 1)
             row_layout.addWidget(add_btn, 0)
@@ -384,17 +668,53 @@ else:
             if initial_text:
                 edit.setText(self._sanitize_option(initial_text))
 
-            insert_index = self.rows_layout.count()
-            if insert_after is not None:
-                idx = self.rows_layout.indexOf(insert_after)
-                if idx >= 0:
-                    insert_index = idx + 1
+            insert_index = len(self._rows)
+            if insert_after is not None and insert_after in self._rows:
+                insert_index = self._rows.index(insert_after) + 1
             self.rows_layout.insertWidget(insert_index, row)
+            self._rows.insert(insert_index, row)
+            self._invalidate_options()
 
             if emit_change:
-                self._refresh_from_rows()
+                self._rows_changed_timer.start()
             return row
 
+        @QtCore.Slot()
+        def _on_add_row_clicked(self) -> None:
+            """Insert a row below the row owning the clicked "+" button."""
+
+            row = getattr(self.sender(), "row", None)
+            self._add_row(insert_after=row)
+
+        @QtCore.Slot()
+        def _on_remove_row_clicked(self) -> None:
+            """Remove the row owning the clicked "-" button."""
+
+            row = getattr(self.sender(), "row", None)
+            if row is not None:
+                self._remove_row(row)
+
+        @QtCore.Slot()
+        def _schedule_refresh(self) -> None:
+            """Restart the debounced combo/summary/chip refresh."""
+
+            self._refresh_timer.start()
+
+        @QtCore.Slot()
+        def _flush_refresh(self) -> None:
+            """Run a pending deferred refresh now (editing finished)."""
+
+            if self._refresh_timer.isActive() or self._rows_changed_timer.isActive():
+                self._refresh_from_rows()
+
+        @QtCore.Slot(str)
+        def _on_row_text_edited(self, text: str) -> None:
+            """Sanitize the option row editor that emitted `textEdited`."""
+
+            edit = self.sender()
+            if isinstance(edit, QtWidgets.QLineEdit):
+                self._sanitize_entry(edit, text)
+
         def _remove_row(self, row: QtWidgets.QWidget) -> None:
             """Remove a row widget (leaving at least one blank row)."""
 
@@ -403,36 +723,31 @@ else:
                 edit = getattr(row, "line_edit", None)
                 if isinstance(edit, QtWidgets.QLineEdit):
                     edit.clear()
-                self._refresh_from_rows()
+                self._rows_changed_timer.start()
                 return
             self.rows_layout.removeWidget(row)
+            if row in self._rows:
+                self._rows.remove(row)
             row.deleteLater()
-            self._refresh_from_rows()
+            self._invalidate_options()
+            self._rows_changed_timer.start()
 
         def _sanitize_entry(self, edit: QtWidgets.QLineEdit, text: str) -> None:
             """Filter invalid characters during typing."""
 
             raw = text or ""
-            cursor = edit.cursorPosition()
-            allowed = "_-"
-            clean_chars: List[str] = []
-            removed_before_cursor = 0
-            for idx, ch in enumerate(raw):
-                if ch.isalnum() or ch in allowed:
-                    clean_chars.append(ch)
-                else:
-                    if idx < cursor:
-                        removed_before_cursor += 1
-            clean = "".join(clean_chars)
+            clean = _INVALID_NAME_CHARS_RE.sub("", raw)
             if clean != raw:
-                new_cursor = max(0, cursor - removed_before_cursor)
-                edit.blockSignals(True)
-                edit.setText(clean)
-                edit.setCursorPosition(new_cursor)
-                edit.blockSignals(False)
-            self._refresh_from_rows()
+                cursor = edit.cursorPosition()
+                # Keep the caret after the same valid character it followed.
+                new_cursor = len(_INVALID_NAME_CHARS_RE.sub("", raw[:cursor]))
+                with _blocked(edit):
+                    edit.setText(clean)
+                    edit.setCursorPosition(new_cursor)
+            self._schedule_refresh()
 
         # ------------------------------------------------------- State helpers
+        @QtCore.Slot(bool)
         def _toggle_collapsed(self, collapsed: bool) -> None:
             """Show/hide the body widget when the header is toggled."""
 
@@ -442,47 +757,39 @@ else:
         def _sanitize_name(self, text: Optional[str]) -> str:
             """Sanitize variant name."""
 
-            value = (text or "").strip()
-            return "".join(ch for ch in value if ch.isalnum() or ch in "_-")
+            return _sanitize_token(text or "")
 
         def _sanitize_option(self, text: Optional[str]) -> str:
             """Sanitize an option entry."""
 
-            value = (text or "").strip()
-            return "".join(ch for ch in value if ch.isalnum() or ch in "_-")
+            return _sanitize_token(text or "")
 
-        def _set_combo_items(
-            self, options: Sequence[str], current_value: Optional[str], emit_signal: bool = True
-        ) -> None:
+        def _set_combo_items(self, options: Sequence[str], current_value: Optional[str]) -> None:
             """Update the combo box items."""
 
             if not isinstance(self.current_combo, QtWidgets.QComboBox):
                 return
-            try:
-                self.current_combo.blockSignals(True)
+            items = list(options)
+            # Row refreshes mostly leave the options alone; only repopulate the
+            # combo model when they actually differ.
+            if items != list(self._combo_index) or self.current_combo.count() != len(items):
                 self.current_combo.clear()
-                for name in options:
-                    self.current_combo.addItem(name)
-                target = current_value if current_value in options else (options[0] if options else "")
-                if target:
-                    idx = self.current_combo.findText(target, QtCore.Qt.MatchFixedString)
-                    if idx >= 0:
-                        self.current_combo.setCurrentIndex(idx)
-                    else:
-                        self.current_combo.setCurrentText(target)
-            finally:
-                if emit_signal:
-                    self.current_combo.blockSignals(False)
-                else:
-                    self.current_combo.blockSignals(False)
+                self.current_combo.addItems(items)
+                self._combo_index = {name: i for i, name in enumerate(items)}
+            target = current_value if current_value in self._combo_index else (items[0] if items else "")
+            if target:
+                self.current_combo.setCurrentIndex(self._combo_index[target])
 
         def _refresh_from_rows(self) -> None:
             """Refresh combo items, summary text, and chips."""
 
             if getattr(self, "_rows_updating", False):
                 return
+            # An immediate refresh supersedes any pending deferred one.
+            self._refresh_timer.stop()
+            self._rows_changed_timer.stop()
             options = self.collect_options()
-            self._set_combo_items(options, self.current_selection(), emit_signal=False)
+            self._set_combo_items(options, self.current_selection())
             self._update_summary(options)
             self._render_chips(options)
             self._change_callback()
@@ -494,48 +801,67 @@ else:
             if count == 0:
                 summary = "No options configured."
             elif count == 1:
-                summary = f"1 option: {options[0]}"
+                summary = f"1 option: {next(iter(options))}"
             elif count <= 4:
                 summary = f"{count} options • {', '.join(options)}"
             else:
-                summary = f"{count} options • {', '.join(options[:3])}…"
+                summary = f"{count} options • {', '.join(itertools.islice(options, 3))}…"
             self.summary_label.setText(summary)
 
         def _render_chips(self, options: Sequence[str]) -> None:
-            """Render small chips for the options."""
+            """Render small chips for the options.
 
-            while self.chip_layout.count():
-                item = self.chip_layout.takeAt(0)
-                widget = item.widget()
-                if widget is not None:
-                    widget.deleteLater()
-            if not options:
-                placeholder = QtWidgets.QLabel("Add options to preview them here.")
-                placeholder.setStyleSheet("color: #6c788d;")
-                self.chip_layout.addWidget(placeholder)
-                self.chip_layout.addStretch(1)
+            Existing chip labels are retargeted in place; only the difference
+            in count is created, and surplus chips are hidden, not deleted.
+            """
+
+            options = tuple(options)
+            if options == self._last_chip_options:
                 return
-            for name in options:
-                chip = QtWidgets.QLabel(name)
-                chip.setStyleSheet(
-                    "background-color: #2f3542; border-radius: 10px; padding: 4px 10px; color: #f0f6ff;"
-                )
-                self.chip_layout.addWidget(chip)
-            self.chip_layout.addStretch(1)
+            self._last_chip_options = options
+            chips = self._chip_widgets
+            # Batch the text/visibility changes into one repaint of the row.
+            with _updates_suspended(self._chip_placeholder.parentWidget()):
+                self._chip_placeholder.setVisible(not options)
+                for idx, name in enumerate(options):
+                    if idx < len(chips):
+                        chip = chips[idx]
+                        chip.setText(name)
+                    else:
+                        chip = QtWidgets.QLabel(name)
+                        chip.setProperty("smChip", True)
+                        self.chip_layout.insertWidget(idx + 1, chip)
+                        chips.append(chip)
+                    chip.show()
+                for chip in chips[len(options):]:
+                    chip.hide()
 
         # -------------------------------------------------------- Event hooks
+        @QtCore.Slot()
+        def _on_remove_clicked(self) -> None:
+            """Ask the owning panel to remove this section."""
+
+            self._remove_callback(self)
+
+        @QtCore.Slot(str)
         def _on_variant_name_edited(self, text: str) -> None:
             """Respond to variant name edits."""
 
             clean = self._sanitize_name(text)
             if clean != text:
                 cursor = self.variant_edit.cursorPosition()
-                self.variant_edit.blockSignals(True)
-                self.variant_edit.setText(clean)
-                self.variant_edit.setCursorPosition(min(cursor, len(clean)))
-                self.variant_edit.blockSignals(False)
+                with _blocked(self.variant_edit):
+                    self.variant_edit.setText(clean)
+                    self.variant_edit.setCursorPosition(min(cursor, len(clean)))
             self._change_callback()
 
+        @QtCore.Slot(int)
+        def _on_current_activated(self, index: int) -> None:
+            """Forward a user pick in the current combo."""
+
+            self._on_default_changed(self.current_combo.itemText(index))
+
+        @QtCore.Slot(str)
         def _on_default_changed(self, _text: str) -> None:
             """Apply the current selection directly to the root GSV.
 
@@ -544,16 +870,23 @@ else:
             themselves, so it does not mark the panel as "unsynced".
             """
 
+            self._selection_callback()
             variant = self.variant_name()
             current = self.current_selection()
             if not variant or not current:
                 return
             try:
+                # Re-picking the active option would only echo back through the
+                # GSV change callback; skip the root write.
+                if gsv_utils.get_variant_value(variant) == current:
+                    return
                 gsv_utils.set_variant_value(variant, current)
             except Exception:
                 # Failing to write to the GSV should not break the UI; the user
                 # can re-sync manually if needed.
                 pass
+            if render_hooks is not None:
+                render_hooks.invalidate_variant_cache()
 
         # ----------------------------------------------------- Variant actions
         def apply_to_gsv(self) -> None:
@@ -565,7 +898,9 @@ else:
                 return
             gsv_utils.ensure_variant_list(variant, options, self.current_selection())
             gsv_utils.ensure_option_sets(options)
+            _bump_gsv_epoch()
 
+        @QtCore.Slot()
         def build_variable_groups(self) -> None:
             """Create VariableGroup scaffolding for each option."""
 
@@ -577,15 +912,17 @@ else:
             if not options:
                 self._show_message("Add at least one option before building VariableGroups.")
                 return
-            for name in options:
-                node = gsv_utils.create_variable_group(self._group_node_name(name))
-                if node is None:
-                    continue
-                try:
-                    node["gsv"].setGsvValue(f"__default__.{variant}", str(name))
-                except Exception:
-                    pass
+            path = f"__default__.{variant}"
+            option_by_group = {self._group_node_name(name): name for name in options}
+
+            def _bind_option(group_name: str, node) -> None:
+                node["gsv"].setGsvValue(path, str(option_by_group[group_name]))
 
+            gsv_utils.create_variable_groups(
+                list(option_by_group), setup=_bind_option, label=f"Build {variant} VariableGroups"
+            )
+
+        @QtCore.Slot()
         def create_variable_switch(self) -> None:
             """Create a VariableSwitch limited to this variant's options."""
 
@@ -604,40 +941,42 @@ else:
                 except Exception:
                     undo = None
 
+            # Everything after `undo.begin` closes the group, even on errors.
             try:
                 try:
-                    switch = nuke.createNode("VariableSwitch", inpanel=False)
-                except Exception:
-                    switch = nuke.nodes.VariableSwitch()
-            except Exception:
-                self._show_message("Unable to create a VariableSwitch node.")
-                if undo is not None:
                     try:
-                        undo.end()
+                        switch = nuke.createNode("VariableSwitch", inpanel=False)
                     except Exception:
-                        pass
-                return
+                        switch = nuke.nodes.VariableSwitch()
+                except Exception:
+                    self._show_message("Unable to create a VariableSwitch node.")
+                    return
 
-            switch_name = f"VariableSwitch_{variant}"
-            try:
-                switch_name = nuke.uniqueName(switch_name)
-                switch.setName(switch_name)
-            except Exception:
+                switch_name = f"VariableSwitch_{variant}"
                 try:
-                    switch_name = switch.name()
+                    switch_name = nuke.uniqueName(switch_name)
+                    switch.setName(switch_name)
                 except Exception:
-                    switch_name = f"VariableSwitch_{variant}"
+                    try:
+                        switch_name = switch.name()
+                    except Exception:
+                        switch_name = f"VariableSwitch_{variant}"
 
-            self._force_switch_variable(switch, variant)
-            self._create_switch_inputs(switch, options, switch_name)
-            self._populate_switch_patterns(switch, options)
-            self._style_variable_switch(switch)
+                # `knobs()` builds a fresh dict each call; fetch it once and share.
+                try:
+                    knobs = switch.knobs()
+                except Exception:
+                    knobs = {}
+                self._force_switch_variable(knobs, variant)
+                self._create_switch_inputs(switch, knobs, options, switch_name)
+                self._populate_switch_patterns(knobs, options)
+                self._style_variable_switch(knobs)
 
-            try:
-                switch.setSelected(True)
-                nuke.show(switch)
-            except Exception:
-                pass
+                try:
+                    switch.setSelected(True)
+                    nuke.show(switch)
+                except Exception:
+                    pass
             finally:
                 if undo is not None:
                     try:
@@ -646,27 +985,34 @@ else:
                         pass
 
         # ------------------------------------------------- VariableSwitch util
-        def _force_switch_variable(self, switch: object, variant: str) -> None:
+        def _force_switch_variable(self, knobs: Dict[str, object], variant: str) -> None:
             """Force the VariableSwitch to reference this variant path."""
 
+            knob = knobs.get("variable")
+            if knob is None:
+                return
             try:
-                switch["variable"].setValue(f"__default__.{variant}")
+                knob.setValue(f"__default__.{variant}")
                 return
             except Exception:
                 pass
             try:
-                switch["variable"].setValue(variant)
+                knob.setValue(variant)
             except Exception:
                 pass
 
         def _create_switch_inputs(
-            self, switch: object, options: Sequence[str], switch_name: str
+            self,
+            switch: object,
+            knobs: Dict[str, object],
+            options: Sequence[str],
+            switch_name: str,
         ) -> None:
             """Create Dot nodes for each option and connect them to the switch."""
 
             try:
-                sx = int(switch["xpos"].value())
-                sy = int(switch["ypos"].value())
+                sx = int(knobs["xpos"].value())
+                sy = int(knobs["ypos"].value())
             except Exception:
                 sx, sy = 0, 0
 
@@ -675,77 +1021,68 @@ else:
             count = len(options)
             start_x = sx - ((count - 1) * spacing_x) // 2 if count > 0 else sx
             target_y = sy - offset_y
-            for idx, name in enumerate(options):
-                try:
-                    dot = nuke.nodes.Dot()
-                except Exception:
-                    dot = None
-                if dot is None:
-                    continue
+            x_positions = range(start_x, start_x + count * spacing_x, spacing_x)
+            make_dot = nuke.nodes.Dot
+            unique_name = getattr(nuke, "uniqueName", None)
+            if not callable(unique_name):
+                # Keep the raw name; a clash only costs the rename below.
+                unique_name = lambda text: text  # noqa: E731
+            dot_name_fmt = "{}_{}_Dot".format
+            safe_switch_name = _INVALID_NODE_NAME_CHARS_RE.sub("_", switch_name)
+            # One guard for creating and wiring each Dot keeps a failing node
+            # from stopping the remaining inputs; naming is guarded separately
+            # so a rejected name never costs the connection.
+            for idx, (name, xpos) in enumerate(zip(options, x_positions)):
                 try:
+                    # Knob values passed to the constructor are applied before
+                    # the node is registered, avoiding per-knob notifications.
+                    dot = make_dot(xpos=xpos, ypos=target_y, label=name)
+                    switch.setInput(idx, dot)
                     dot.setSelected(False)
                 except Exception:
-                    pass
-                try:
-                    dot_name = nuke.uniqueName(f"{switch_name}_{name}_Dot")
-                    dot.setName(dot_name)
-                except Exception:
-                    pass
-                try:
-                    dot["xpos"].setValue(start_x + idx * spacing_x)
-                    dot["ypos"].setValue(target_y)
-                    dot["label"].setValue(name)
-                except Exception:
-                    pass
+                    continue
                 try:
-                    switch.setInput(idx, dot)
+                    safe_name = _INVALID_NODE_NAME_CHARS_RE.sub("_", name)
+                    dot.setName(unique_name(dot_name_fmt(safe_switch_name, safe_name)))
                 except Exception:
                     pass
 
-        def _populate_switch_patterns(self, switch: object, options: Sequence[str]) -> None:
+        def _populate_switch_patterns(
+            self, knobs: Dict[str, object], options: Sequence[str]
+        ) -> None:
             """Populate the VariableSwitch pattern knob with option names."""
 
             if not options:
                 return
-            patterns = None
-            try:
-                patterns = switch["patterns"]
-            except Exception:
-                patterns = None
+            patterns = knobs.get("patterns")
             if patterns is not None:
-                text = "\n".join(str(name) for name in options)
+                text = "\n".join(options)
                 try:
                     patterns.setValue(text)
                     return
                 except Exception:
                     pass
             try:
-                knobs = switch.knobs()
+                for idx, name in enumerate(options):
+                    knob = knobs.get(f"i{idx}")
+                    if knob is not None:
+                        knob.setValue(name)
             except Exception:
-                knobs = {}
-            for idx, name in enumerate(options):
-                key = f"i{idx}"
-                knob = knobs.get(key)
-                if knob is None:
-                    continue
-                try:
-                    knob.setValue(str(name))
-                except Exception:
-                    pass
+                pass
 
-        def _style_variable_switch(self, switch: object) -> None:
+        def _style_variable_switch(self, knobs: Dict[str, object]) -> None:
             """Apply consistent labeling/color to the created VariableSwitch."""
 
             try:
-                switch["label"].setValue("[value variable]")
+                knobs["label"].setValue("[value variable]")
             except Exception:
                 pass
             try:
-                switch["tile_color"].setValue(SWITCH_TILE_COLOR)
+                knobs["tile_color"].setValue(SWITCH_TILE_COLOR)
             except Exception:
                 pass
             try:
-                switch["node_font_color"].setValue(4294967295)
+                knobs["node_font_color"].setValue(4294967295)
             except Exception:
                 pass
 
@@ -780,12 +1117,24 @@ else:
             self.setWindowTitle("Switch Manager")
             self.setObjectName("SwitchManagerPanel")
             SwitchManagerPanel.instance = self
+            _PANEL_REGISTRY[self.objectName()] = self
             self._is_synced = False
             self._sections_locked = False
+            self._active_values: Optional[Dict[str, str]] = None
             self._status_timer = None
             self._focus_tracking_ready = False
-            self._build_ui()
-            self._load_from_gsv()
+            self._logo_height: Optional[int] = None
+            self._reload_pending = False
+            self._suspend_reload = False
+            # (variants, selections) last loaded into a synced UI.
+            self._last_gsv_signature: Optional[tuple] = None
+            self._deferred_built = False
+            self._rescale_timer = QtCore.QTimer(self)
+            self._rescale_timer.setSingleShot(True)
+            self._rescale_timer.timeout.connect(self._rescale_logo)
+            with _updates_suspended(self):
+                self._build_ui()
+                self._load_from_gsv()
             self._install_gsv_callback()
             self._install_focus_tracking()
             self._update_sync_status(force=True)
@@ -795,6 +1144,8 @@ else:
             """Construct the panel UI."""
 
             self.setMinimumWidth(460)
+            # Set before any child exists, so no widget is re-polished.
+            self.setStyleSheet(_ACTION_BUTTON_QSS)
             layout = QtWidgets.QVBoxLayout(self)
             layout.setContentsMargins(12, 12, 12, 12)
             layout.setSpacing(10)
@@ -817,17 +1168,36 @@ else:
             self.add_variant_btn = QtWidgets.QPushButton("+ Add Variant", self)
             self.add_variant_btn.setToolTip("Add another variant / option set.")
             self.add_variant_btn.setFixedHeight(32)
-            self.add_variant_btn.clicked.connect(lambda *_: self._add_variant_section())
+            self.add_variant_btn.clicked.connect(self._on_add_variant_clicked)
             layout.addWidget(self.add_variant_btn, 0)
 
-            actions = QtWidgets.QGroupBox("Quick Actions", self)
+            # Quick Actions and the wrap button are filled in on first show
+            # (`_build_ui_deferred`); a docked-but-hidden panel never pays for them.
+            self._actions_host = QtWidgets.QWidget(self)
+            self._actions_host_layout = QtWidgets.QVBoxLayout(self._actions_host)
+            self._actions_host_layout.setContentsMargins(0, 0, 0, 0)
+            self._actions_host_layout.setSpacing(10)
+            layout.addWidget(self._actions_host)
+
+            layout.addStretch(1)
+            layout.addWidget(self._build_status_bar())
+
+        def _build_ui_deferred(self) -> None:
+            """Build the action buttons and header logo, once, on first show."""
+
+            if self._deferred_built:
+                return
+            self._deferred_built = True
+            host_layout = self._actions_host_layout
+
+            actions = QtWidgets.QGroupBox("Quick Actions", self._actions_host)
             actions_layout = QtWidgets.QGridLayout(actions)
             actions_layout.setHorizontalSpacing(8)
             actions_layout.setVerticalSpacing(8)
 
             self.sync_btn = QtWidgets.QPushButton("Sync Options", actions)
             self.edit_btn = QtWidgets.QPushButton("Edit Options", actions)
-            self.wrap_btn = QtWidgets.QPushButton("Lock Options (select Write node)", actions)
+            self.wrap_btn = QtWidgets.QPushButton("Lock Options (select Write node)", self._actions_host)
 
             self._style_action_button(self.sync_btn, role="primary")
             self._style_action_button(self.edit_btn, role="secondary")
@@ -835,17 +1205,25 @@ else:
 
             actions_layout.addWidget(self.sync_btn, 0, 0, 1, 2)
             actions_layout.addWidget(self.edit_btn, 1, 0, 1, 2)
-            layout.addWidget(actions)
-
-            layout.addWidget(self.wrap_btn)
-
-            layout.addStretch(1)
-            layout.addWidget(self._build_status_bar())
+            host_layout.addWidget(actions)
+            host_layout.addWidget(self.wrap_btn)
 
             self.sync_btn.clicked.connect(self._on_sync)
             self.edit_btn.clicked.connect(self._on_edit)
             self.wrap_btn.clicked.connect(self._on_wrap)
 
+            # Pick up the lock state applied while the buttons did not exist.
+            self.edit_btn.setEnabled(self._sections_locked)
+            self._install_logo_pixmap()
+
+        def showEvent(self, event):  # type: ignore[override]
+            """Finish building the panel the first time it becomes visible."""
+
+            if not self._deferred_built:
+                with _updates_suspended(self):
+                    self._build_ui_deferred()
+            super().showEvent(event)
+
         def _build_header(self) -> QtWidgets.QWidget:
             """Return the branded header widget."""
 
@@ -868,7 +1246,6 @@ else:
             self.logo_label.setAlignment(QtCore.Qt.AlignCenter)
             self.logo_label.setMinimumSize(72, 72)
             self.logo_label.setMaximumHeight(128)
-            self._install_logo_pixmap()
             layout.addWidget(self.logo_label, 0)
 
             title_block = QtWidgets.QVBoxLayout()
@@ -884,37 +1261,19 @@ else:
             return header
 
         def _style_action_button(self, button: QtWidgets.QPushButton, role: str = "secondary") -> None:
-            """Apply consistent styling to the main action buttons."""
-
-            palette = {
-                "primary": ("#2f7bf2", "#2462c1"),
-                "accent": ("#a68a00", "#2f7c55"),
-                "secondary": ("#3a3f4b", "#2b2f38"),
-            }
-            normal, pressed = palette.get(role, palette["secondary"])
+            """Apply consistent styling to the main action buttons.
+
+            Colours come from the panel-wide `_ACTION_BUTTON_QSS`, selected by
+            the button's `smRole` property.
+            """
+
+            if role not in _ACTION_BUTTON_PALETTE:
+                role = "secondary"
             button.setMinimumHeight(44)
             button.setCheckable(False)
             button.setProperty("smRole", role)
             if QtGui is not None:
                 button.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
-            button.setStyleSheet(
-                f"""
-                QPushButton[smRole="{role}"] {{
-                    background-color: {normal};
-                    border: 1px solid rgba(255,255,255,0.08);
-                    border-radius: 6px;
-                    padding: 6px 10px;
-                    color: #f5f5f5;
-                    font-weight: 500;
-                }}
-                QPushButton[smRole="{role}"]:hover {{
-                    border-color: rgba(255,255,255,0.2);
-                }}
-                QPushButton[smRole="{role}"]:pressed {{
-                    background-color: {pressed};
-                }}
-                """
-            )
             if role == "primary":
                 button.setDefault(True)
 
@@ -923,35 +1282,61 @@ else:
 
             if QtGui is None:
                 return
+            # Installed on first show, so size it for the panel right away
+            # instead of a fixed 96px that the next resize would replace.
+            height = self._target_logo_height()
             try:
-                this_dir = os.path.dirname(os.path.abspath(__file__))
-                root_dir = os.path.dirname(this_dir)
-                candidates = [os.path.join(root_dir, "switch_manager_logo_alpha.png")]
-                path = next((p for p in candidates if os.path.exists(p)), None)
-                if path is None:
-                    return
-                self._logo_pixmap = QtGui.QPixmap(path)
-                if not self._logo_pixmap.isNull():
-                    scaled = self._logo_pixmap.scaledToHeight(96, QtCore.Qt.SmoothTransformation)
+                scaled = _scaled_logo(height)
+                if scaled is not None:
                     self.logo_label.setPixmap(scaled)
+                    self._logo_height = height
             except Exception:
                 pass
 
+        def _target_logo_height(self) -> int:
+            """Return the logo height for the current panel size, step-quantized."""
+
+            height = max(72, min(128, int(self.height() * 0.18)))
+            return round(height / _LOGO_HEIGHT_STEP) * _LOGO_HEIGHT_STEP
+
         def resizeEvent(self, event):  # type: ignore[override]
             """Keep the header image nicely scaled."""
 
+            # The logo tracks the panel height only, so width-only drags (the
+            # common case for a docked pane) never need a rescale. Restarting
+            # the single-shot timer collapses a resize drag into one rescale.
             try:
-                if QtGui is not None and hasattr(self, "_logo_pixmap"):
-                    max_height = max(72, min(128, int(self.height() * 0.18)))
-                    scaled = self._logo_pixmap.scaledToHeight(
-                        max_height, QtCore.Qt.SmoothTransformation
-                    )
-                    self.logo_label.setPixmap(scaled)
+                height_changed = event.oldSize().height() != event.size().height()
             except Exception:
-                pass
+                height_changed = True
+            if height_changed:
+                self._rescale_timer.start(50)
             super().resizeEvent(event)
 
+        def _rescale_logo(self) -> None:
+            """Rescale the header logo from the shared per-height cache."""
+
+            if QtGui is None or self._logo_height is None:
+                return
+            max_height = self._target_logo_height()
+            if max_height == self._logo_height:
+                return
+            try:
+                scaled = _scaled_logo(max_height)
+                if scaled is None:
+                    return
+                self.logo_label.setPixmap(scaled)
+            except Exception:
+                return
+            self._logo_height = max_height
+
         # -------------------------------------------------------- Sections API
+        @QtCore.Slot()
+        def _on_add_variant_clicked(self) -> None:
+            """Append an empty variant section."""
+
+            self._add_variant_section()
+
         def _add_variant_section(
             self,
             variant_name: str = "",
@@ -965,6 +1350,7 @@ else:
             section = VariantSectionWidget(
                 change_callback=self._mark_unsynced,
                 remove_callback=self._remove_section,
+                selection_callback=self._invalidate_active_values,
                 variant_name=variant_name,
                 options=options or [],
                 current_value=current_value,
@@ -972,6 +1358,7 @@ else:
                 parent=self.sections_holder,
             )
             self.sections_layout.addWidget(section)
+            self._invalidate_active_values()
             return section
 
         def _remove_section(self, section: VariantSectionWidget) -> None:
@@ -980,7 +1367,7 @@ else:
             widgets = self._section_widgets()
             if len(widgets) <= 1:
                 section.set_variant_name("", emit_signal=False)
-                section.set_options([], emit_signal=False)
+                section.set_options([])
                 self._set_sections_locked(False)
                 self._mark_unsynced()
                 return
@@ -1136,7 +1523,7 @@ else:
         def _gsv_state_matches_ui(self) -> bool:
             """Return True when UI variants/options mirror the root GSV."""
 
-            gsv_variants = gsv_utils.discover_list_variants()
+            gsv_variants = _list_variants()
             section_map: Dict[str, VariantSectionWidget] = {}
             for section in self._section_widgets():
                 name = section.variant_name()
@@ -1194,45 +1581,129 @@ else:
                 add_btn.setEnabled(not locked_flag)
 
         # ----------------------------------------------------------- GSV sync
-        def _load_from_gsv(self) -> None:
-            """Rebuild the UI from current GSV list variants."""
+        def _load_from_gsv(self, force: bool = False) -> None:
+            """Rebuild the UI from current GSV list variants.
 
-            variants = gsv_utils.discover_list_variants()
-            self._clear_sections()
-            if not variants:
-                self._add_variant_section()
-                self._set_sections_locked(False)
-                self._mark_unsynced()
+            Callback-driven reloads skip work when the synced UI already shows
+            the GSV state; `force` (used by `_on_sync`) always re-locks and
+            marks the sections synced.
+            """
+
+            variants = _list_variants()
+            currents = {name: gsv_utils.get_variant_value(name) for name in variants}
+            signature = (
+                tuple((name, tuple(variants[name])) for name in sorted(variants)),
+                tuple(sorted(currents.items())),
+            )
+            if not force and self._is_synced and signature == self._last_gsv_signature:
+                # Unrelated GSV change: the synced UI already shows this state.
                 return
-            for name in sorted(variants.keys()):
-                options = variants.get(name, [])
-                current = gsv_utils.get_variant_value(name)
-                section = self._add_variant_section(name, options, current, locked=True)
-                section.set_locked(True)
-            self._set_sections_locked(True)
+            if variants and self._sections_match(variants):
+                # Same variants/options: only the selections can have moved.
+                for section in self._section_widgets():
+                    section.set_current_value(currents.get(section.variant_name()))
+                self._set_sections_locked(True)
+                self._mark_synced()
+                self._last_gsv_signature = signature
+                return
+            # Full rebuild: repaint once at the end, not per removed/added section.
+            with _updates_suspended(self):
+                self._clear_sections()
+                if not variants:
+                    self._add_variant_section()
+                    self._set_sections_locked(False)
+                    self._mark_unsynced()
+                    return
+                for name in sorted(variants.keys()):
+                    options = variants.get(name, [])
+                    section = self._add_variant_section(name, options, currents[name], locked=True)
+                    section.set_locked(True)
+                self._set_sections_locked(True)
             self._mark_synced()
+            self._last_gsv_signature = signature
+
+        def _sections_match(self, variants: Dict[str, List[str]]) -> bool:
+            """Return True when the sections already show `variants` in load order."""
+
+            sections = self._section_widgets()
+            if len(sections) != len(variants):
+                return False
+            return all(
+                section.variant_name() == name and section.collect_options() == variants[name]
+                for section, name in zip(sections, sorted(variants))
+            )
 
         def _install_gsv_callback(self) -> None:
-            """Keep the panel in sync with the root GSV knob."""
+            """Keep the panel in sync with the root GSV knob.
 
+            Nuke's callback list only grows, so the handlers are registered
+            once per process (even across reloads of this module) and always
+            dispatch to the live module's `SwitchManagerPanel.instance`.
+            """
+
+            global _GSV_CALLBACK_ACTIVE
             if nuke is None:
                 return
             try:
                 callbacks = getattr(nuke, "callbacks", None)
-                if callbacks and hasattr(callbacks, "onGsvSetChanged"):
-                    def _handler(*_args, **_kwargs):
-                        try:
-                            self._load_from_gsv()
-                        except Exception:
-                            pass
-
-                    callbacks.onGsvSetChanged(_handler)
+                if not callbacks or not hasattr(callbacks, "onGsvSetChanged"):
+                    return
+                if not getattr(callbacks, _GSV_DISPATCH_MARKER, False):
+                    callbacks.onGsvSetChanged(_dispatch_gsv_change)
+                    for name in ("addOnScriptLoad", "addOnScriptClose"):
+                        register = getattr(nuke, name, None)
+                        if callable(register):
+                            register(_dispatch_script_change)
+                    add_knob_changed = getattr(nuke, "addKnobChanged", None)
+                    if callable(add_knob_changed):
+                        add_knob_changed(_dispatch_root_knob_changed, nodeClass="Root")
+                    setattr(callbacks, _GSV_DISPATCH_MARKER, True)
+                _GSV_CALLBACK_ACTIVE = True
+            except Exception:
+                pass
+
+        def _schedule_gsv_reload(self) -> None:
+            """Queue one `_load_from_gsv` for the next event-loop pass.
+
+            Bulk GSV edits fire the change callback repeatedly; they now
+            collapse into a single reload once the edit settles.
+            """
+
+            if self._reload_pending or self._suspend_reload:
+                return
+            self._reload_pending = True
+            QtCore.QTimer.singleShot(0, self._run_pending_reload)
+
+        @contextlib.contextmanager
+        def _silenced(self) -> Iterator[None]:
+            """Ignore GSV change callbacks while the panel writes the GSV itself.
+
+            The caller reloads explicitly afterwards, so the callback-driven
+            reload would only repeat that work.
+            """
+
+            previous = self._suspend_reload
+            self._suspend_reload = True
+            try:
+                yield
+            finally:
+                self._suspend_reload = previous
+
+        def _run_pending_reload(self) -> None:
+            """Run the reload queued by `_schedule_gsv_reload`, unless cancelled."""
+
+            if not self._reload_pending:
+                return
+            self._reload_pending = False
+            try:
+                self._load_from_gsv()
             except Exception:
                 pass
 
         def _mark_synced(self) -> None:
             """Update the status label to show a synced state."""
 
+            self._invalidate_active_values()
             self._is_synced = True
             self._render_status_message(True)
             self._set_sections_locked(True)
@@ -1240,40 +1711,56 @@ else:
         def _mark_unsynced(self) -> None:
             """Update the status label to show the panel needs syncing."""
 
+            self._invalidate_active_values()
             self._is_synced = False
             self._render_status_message(False)
 
         # -------------------------------------------------------------- Actions
+        @QtCore.Slot()
         def _on_sync(self) -> None:
             """Sync every valid variant back to GSV."""
 
-            existing_variants = set(gsv_utils.discover_list_variants().keys())
+            existing_variants = set(_list_variants().keys())
             synced_variants: set[str] = set()
 
             wrote_any = False
+            specs: Dict[str, tuple] = {}
+            option_names: List[str] = []
             for section in self._section_widgets():
                 if not section.is_syncable():
                     continue
-                section.apply_to_gsv()
-                synced_variants.add(section.variant_name())
+                variant = section.variant_name()
+                options = section.collect_options()
+                specs[variant] = (options, section.current_selection())
+                option_names.extend(options)
+                synced_variants.add(variant)
                 wrote_any = True
 
             removed_variants = existing_variants - synced_variants
-            for variant in removed_variants:
-                gsv_utils.remove_variant(variant)
+            with self._silenced():
+                if specs:
+                    gsv_utils.ensure_variant_lists_bulk(specs)
+                    gsv_utils.ensure_option_sets(option_names)
+                for variant in removed_variants:
+                    gsv_utils.remove_variant(variant)
 
             if removed_variants:
                 wrote_any = True
 
             if wrote_any:
-                self._load_from_gsv()
+                _bump_gsv_epoch()
+                # This reload supersedes any callback-driven one still queued.
+                self._reload_pending = False
+                self._load_from_gsv(force=True)
 
+        @QtCore.Slot()
         def _on_edit(self) -> None:
             """Unlock all variant sections for editing."""
 
             self._set_sections_locked(False)
             self._update_sync_status(force=True)
 
+        @QtCore.Slot()
         def _on_wrap(self) -> None:
             """Wrap the selected Write/Group with a VariableGroup."""
 
@@ -1282,6 +1769,13 @@ else:
             helper = getattr(render_hooks, "encapsulate_write_with_variable_group", None)
             if helper is None:
                 return
+            try:
+                selected = nuke.selectedNodes()
+            except Exception:
+                selected = []
+            batch_helper = getattr(render_hooks, "encapsulate_writes", None)
+            if len(selected) > 1 and batch_helper is not None:
+                helper = batch_helper
             try:
                 helper()
             except Exception:
@@ -1294,15 +1788,25 @@ else:
 
         # ---------------------------------------------------------- Panel API
         def get_active_variant_values(self) -> Dict[str, str]:
-            """Return {variant: selection} for all configured variants."""
+            """Return {variant: selection} for all configured variants.
 
-            values: Dict[str, str] = {}
-            for section in self._section_widgets():
-                name = section.variant_name()
-                current = section.current_selection()
-                if name and current:
-                    values[name] = current
-            return values
+            The mapping is cached until a section or selection changes.
+            """
+
+            if self._active_values is None:
+                values: Dict[str, str] = {}
+                for section in self._section_widgets():
+                    name = section.variant_name()
+                    current = section.current_selection()
+                    if name and current:
+                        values[name] = current
+                self._active_values = values
+            return dict(self._active_values)
+
+        def _invalidate_active_values(self) -> None:
+            """Forget the cached variant selections."""
+
+            self._active_values = None
 
         def set_default_variant_value(self, variant: str, value: str) -> bool:
             """Update the combo box for the requested variant, if it exists."""
@@ -1310,9 +1814,13 @@ else:
             for section in self._section_widgets():
                 if section.variant_name() == variant:
                     options = section.collect_options()
-                    if value and value not in options:
+                    if value in options:
+                        # Already listed: move the selection, no rebuild.
+                        section.set_current_value(value)
+                        return True
+                    if value:
                         options.append(value)
-                    section.set_options(options, current_value=value, emit_signal=False)
+                    section.set_options(options, current_value=value)
                     return True
             # Variant not found—add a new section to host it.
             section = self._add_variant_section(variant_name=variant, options=[value], current_value=value)
@@ -1328,10 +1836,13 @@ def set_default_screen_via_ui(name: str) -> bool:
     inst = getattr(SwitchManagerPanel, "instance", None)
     if inst is not None:
         return inst.set_default_variant_value("screens", name)
-    app = QtWidgets.QApplication.instance()
-    if app is None:
-        return False
-    panel = app.findChild(QtWidgets.QWidget, "SwitchManagerPanel")
+    panel = _PANEL_REGISTRY.get("SwitchManagerPanel")
+    if panel is None:
+        # Last resort: a panel built by another copy of this module.
+        app = QtWidgets.QApplication.instance()
+        if app is None:
+            return False
+        panel = app.findChild(QtWidgets.QWidget, "SwitchManagerPanel")
     if panel is None or not hasattr(panel, "set_default_variant_value"):
         return False
     try:
@@ -1341,4 +1852,9 @@ def set_default_screen_via_ui(name: str) -> bool:
         return False
 
 
+# A reload defines a new panel class; make render_hooks resolve it again.
+if render_hooks is not None and hasattr(render_hooks, "invalidate_panel_cache"):
+    render_hooks.invalidate_panel_cache()
+
+
 __all__ = ["SwitchManagerPanel", "set_default_screen_via_ui"]